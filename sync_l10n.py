@@ -1,6 +1,8 @@
 # Python 3.8+ with type annotations and dataclasses
 from __future__ import annotations
-import os, shutil, codecs, enum, re, argparse
+import os, io, sys, shutil, codecs, re, argparse, functools, mmap, copy, hashlib, json
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+import xml.etree.ElementTree as ET
 from dataclasses import dataclass
 from typing import List, Dict, Optional
 
@@ -13,134 +15,91 @@ OUTPUT_DIR         = os.path.join(SCRIPT_DIR, 'output')
 VARIANT_KRLFG      = os.path.join(SCRIPT_DIR, 'variant_krlfg')
 OUTPUT_KRLFG       = os.path.join(SCRIPT_DIR, 'output_krlfg')
 
+# Manifest of input digests from the previous run, keyed by output file.
+# When a file's inputs are unchanged and its output still exists, the whole
+# parse/diff/write pipeline for it is skipped.
+SYNC_CACHE_PATH    = os.path.join(SCRIPT_DIR, '.sync_cache.json')
+
+def load_sync_cache() -> Dict[str, str]:
+    try:
+        with open(SYNC_CACHE_PATH, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return dict()
+
+def save_sync_cache(sync_cache: Dict[str, str]):
+    with open(SYNC_CACHE_PATH, 'w', encoding='utf-8') as f:
+        json.dump(sync_cache, f, indent=2, sort_keys=True)
+
+def compute_input_digest(paths: List[str]) -> str:
+    # One combined digest over all of a file's inputs; missing files (patch
+    # or variant dictionaries are optional) hash as empty.
+    digest = hashlib.sha256()
+    for path in paths:
+        try:
+            with open(path, 'rb') as f:
+                data = f.read()
+        except OSError:
+            data = b''
+        digest.update(len(data).to_bytes(8, 'little'))
+        digest.update(data)
+    return digest.hexdigest()
+
+
+# The game XML files are not strictly well-formed: bodies contain bare '&'
+# characters and HTML entities like '&rdquo;' that a conforming parser rejects.
+# Protect those as '&amp;' so the C-accelerated expat parser accepts the file;
+# escapeAionXml() below is the matching inverse used when writing.
+BARE_AMPERSAND_RE = re.compile(r'&(?!(?:amp|lt|gt|apos|quot|#[0-9]+|#x[0-9a-fA-F]+);)')
+
+def iterparseAionXml(data: str):
+    # Stream the root's direct children (the <string>/<string_tip> elements)
+    # with iterparse instead of materializing the whole tree: each element is
+    # released once the caller has consumed it, so peak memory stays bounded
+    # by one element instead of the full document.
+    # ElementTree refuses str input that carries an encoding declaration and
+    # the game files declare utf-16, so drop the declaration: 'data' is
+    # already decoded.
+    decl_end = data.find('?>')
+    if decl_end != -1:
+        data = data[decl_end + 2:]
+    data = BARE_AMPERSAND_RE.sub('&amp;', data)
+
+    root = None
+    depth = 0
+    for event, element in ET.iterparse(io.StringIO(data), events=('start', 'end')):
+        if event == 'start':
+            if root is None:
+                root = element
+            depth += 1
+        else:
+            depth -= 1
+            if depth == 1:
+                yield element
+                root.clear()
+
+def escapeAionXml(text: str) -> str:
+    # The game files only ever escape '<' and '>'; '&' stays bare.
+    return text.replace('<', '&lt;').replace('>', '&gt;')
 
-@dataclass
-class XMLElement:
-    name: str
-    text: str
-    children: List[XMLElement] 
-
-    def find(self, name: str) -> Optional[XMLElement]:
-        for child in self.children:
-            if child.name == name:
-                return child
-        return None
-
-def parseAionXml(data: str) -> XMLElement:
-    class ParserState(enum.Enum):
-        DOCUMENT_START = 1
-        XML_DECL_OPENING = 2
-        XML_DECL = 3
-        XML_DECL_CLOSING = 4
-        BEFORE_ROOT = 5
-        UNKNOWN_TAG = 6
-        BEGIN_TAG = 7
-        BEGIN_TAG_ATTRIBUTES = 8
-        END_TAG = 9
-        TEXT = 10
-
-    state: ParserState = ParserState.DOCUMENT_START
-    element_stack: List[XMLElement] = list()
-    current_element: Optional[XMLElement] = None
-    tag_name_list: List[str] = list()
-    text_list_stack: List[List[str]] = list()
-    text_list: List[str] = list()
-
-    for c in data:
-        if state == ParserState.DOCUMENT_START:
-            if c != "<":
-                raise Exception("Expected XML declaration opening '<'")
-            state = ParserState.XML_DECL_OPENING
-
-        elif state == ParserState.XML_DECL_OPENING:
-            if c != "?":
-                raise Exception("Expected XML declaration opening '?'")
-            state = ParserState.XML_DECL
-
-        elif state == ParserState.XML_DECL:
-            if c == "?":
-                state = ParserState.XML_DECL_CLOSING
-
-        elif state == ParserState.XML_DECL_CLOSING:
-            if c == ">":
-                state = ParserState.BEFORE_ROOT
-            else:
-                state = ParserState.XML_DECL
-
-        elif state == ParserState.BEFORE_ROOT:
-            if c == "<":
-                state = ParserState.UNKNOWN_TAG
-
-        elif state == ParserState.UNKNOWN_TAG:
-            if c == "/":
-                state = ParserState.END_TAG
-            else:
-                tag_name_list.append(c)
-                state = ParserState.BEGIN_TAG
-        
-        elif state == ParserState.BEGIN_TAG:
-            if c == ">":
-                text_list_stack.append(text_list)
-                text_list = list()
-
-                if current_element is not None:
-                    element_stack.append(current_element)
-                current_element = XMLElement(''.join(tag_name_list), "", list())
-
-                tag_name_list = list()
-
-                state = ParserState.TEXT
-            elif c == " ":
-                state = ParserState.BEGIN_TAG_ATTRIBUTES
-            else:
-                tag_name_list.append(c)
-
-        elif state == ParserState.BEGIN_TAG_ATTRIBUTES:
-            if c == ">":
-                text_list_stack.append(text_list)
-                text_list = list()
-
-                if current_element is not None:
-                    element_stack.append(current_element)
-                current_element = XMLElement(''.join(tag_name_list), "", list())
-
-                tag_name_list = list()
-
-                state = ParserState.TEXT
-
-        elif state == ParserState.END_TAG:
-            if c == ">":
-                tag_name = ''.join(tag_name_list)
-                if tag_name != current_element.name:
-                    raise Exception(f"Mismatching tag name: '{tag_name}'")
-                tag_name_list = list()
-
-                current_element.text = ''.join(text_list)
-                text_list = text_list_stack.pop()
-
-                if len(element_stack) == 0:
-                    return current_element
-                else:
-                    parent_element = element_stack.pop()
-                    parent_element.children.append(current_element)
-                    current_element = parent_element
-
-                state = ParserState.TEXT
-            else:
-                tag_name_list.append(c)
-
-        elif state == ParserState.TEXT:
-            if c == "<":
-                state = ParserState.UNKNOWN_TAG
-            else:
-                text_list.append(c)
-
-    return None
-            
 EXPRESSION_RE = re.compile(r"\[%[^%\]].*?\]|%[0-9]")
 
-@dataclass
+@functools.lru_cache(maxsize=None)
+def body_expressions(body: str) -> frozenset:
+    # Memoized: the same body is compared repeatedly across the
+    # reference/patch/variant merges and the two package runs.
+    return frozenset(EXPRESSION_RE.findall(body))
+
+# eq=False: nothing compares whole AionString instances, so skip the
+# generated field-by-field __eq__ and keep identity semantics.
+@dataclass(eq=False)
 class AionString:
+    # Manual __slots__ (dataclass slots=True needs 3.10+, we target 3.8):
+    # tens of thousands of instances are alive at once across the client,
+    # reference, patch and merged dicts, and the per-instance __dict__ would
+    # roughly triple their footprint.
+    __slots__ = ('tag_name', 'id_value', 'name', 'body', 'message_type', 'display_type', 'ment', 'rank', 'body_exprs')
+
     tag_name: str
     id_value: int
     name: str
@@ -149,56 +108,99 @@ class AionString:
     display_type: Optional[int]
     ment: Optional[str]
     rank: Optional[int]
+    # Expression set of body, extracted once at read time so comparisons in
+    # match_and_repair need no regex work at all.
+    body_exprs: frozenset
 
-    def match_and_repair(self, other: AionString, silent: bool =False) -> bool:
+    def match_and_repair(self, other: AionString, silent: bool =False, log=print) -> bool:
         if self.id_value != other.id_value:
-            print(f"[critical] <id> mismatch: client: {self.id_value}, L10N: {other.id_value}")
+            log(f"[critical] <id> mismatch: client: {self.id_value}, L10N: {other.id_value}")
             return False
 
         if self.name != other.name:
-            print(f"[error] {self.id_value}: <name> mismatch: client: {self.name}, L10N: {other.name}")
+            log(f"[error] {self.id_value}: <name> mismatch: client: {self.name}, L10N: {other.name}")
             return False
 
-        # Repair mismatching values
-        if self.message_type != other.message_type:
-            if not silent:
-                print(f"[action] {self.id_value}|{self.name}: repairing <message_type>: {self.message_type}, L10N: {other.message_type}")
-            other.message_type = self.message_type
+        # Repair mismatching values (one aggregated compare skips the four
+        # per-field checks in the common everything-matches case)
+        if (self.message_type, self.display_type, self.ment, self.rank) != (other.message_type, other.display_type, other.ment, other.rank):
+            if self.message_type != other.message_type:
+                if not silent:
+                    log(f"[action] {self.id_value}|{self.name}: repairing <message_type>: {self.message_type}, L10N: {other.message_type}")
+                other.message_type = self.message_type
 
-        if self.display_type != other.display_type:
-            if not silent:
-                print(f"[action] {self.id_value}|{self.name}: repairing <display_type>: client: {self.display_type}, L10N: {other.display_type}")
-            other.display_type = self.display_type
+            if self.display_type != other.display_type:
+                if not silent:
+                    log(f"[action] {self.id_value}|{self.name}: repairing <display_type>: client: {self.display_type}, L10N: {other.display_type}")
+                other.display_type = self.display_type
 
-        if self.ment != other.ment:
-            if not silent:
-                print(f"[action] {self.id_value}|{self.name}: repairing <ment>: client: {self.ment}, L10N: {other.ment}")
-            other.ment = self.ment
+            if self.ment != other.ment:
+                if not silent:
+                    log(f"[action] {self.id_value}|{self.name}: repairing <ment>: client: {self.ment}, L10N: {other.ment}")
+                other.ment = self.ment
 
-        if self.rank != other.rank:
-            if not silent:
-                print(f"[action] {self.id_value}|{self.name}: repairing <rank>: client: {self.rank}, L10N: {other.rank}")
-            other.rank = self.rank
+            if self.rank != other.rank:
+                if not silent:
+                    log(f"[action] {self.id_value}|{self.name}: repairing <rank>: client: {self.rank}, L10N: {other.rank}")
+                other.rank = self.rank
+
+        # match expressions (equal bodies cannot mismatch, skip the regex scan)
+        if self.body == other.body:
+            return True
 
-        # match expressions
         if self.body is None and other.body is not None and other.body != '':
             if not silent:
-                print(f"[warn] {self.id_value}|{self.name}: repairing <body>: client <body> does not exist, but L10N <body> exists: '{other.body}' !")
+                log(f"[warn] {self.id_value}|{self.name}: repairing <body>: client <body> does not exist, but L10N <body> exists: '{other.body}' !")
             other.body = None
         elif self.body is not None and self.body != '' and other.body is None:
             if not silent:
-                print(f"[error] {self.id_value}|{self.name}: <body> mismatch: client <body> exists: '{self.body}', but L10N <body> does not exist!")
+                log(f"[error] {self.id_value}|{self.name}: <body> mismatch: client <body> exists: '{self.body}', but L10N <body> does not exist!")
         elif self.body is not None and other.body is not None:
-            client_exprs = set(EXPRESSION_RE.findall(self.body))
-            l10n_exprs = set(EXPRESSION_RE.findall(other.body))
-            if client_exprs != l10n_exprs:
+            if self.body_exprs != other.body_exprs:
                 if not silent:
-                    print(f"[warn] {self.id_value}|{self.name}: <body> expression mismatch: client: {client_exprs}, L10N: {l10n_exprs}")
+                    log(f"[warn] {self.id_value}|{self.name}: <body> expression mismatch: client: {self.body_exprs}, L10N: {other.body_exprs}")
 
         return True
 
+    def serialize(self) -> str:
+        # Most strings carry no optional fields, so one f-string covers the
+        # whole block without a per-field list and join.
+        optional = ''
+        if self.body is not None:
+            optional += f"    <body>{escapeAionXml(self.body)}</body>\r\n"
+        if self.message_type is not None:
+            optional += f"    <message_type>{escapeAionXml(self.message_type)}</message_type>\r\n"
+        if self.display_type is not None:
+            optional += f"    <display_type>{self.display_type}</display_type>\r\n"
+        if self.ment is not None:
+            optional += f"    <ment>{escapeAionXml(self.ment)}</ment>\r\n"
+        if self.rank is not None:
+            optional += f"    <rank>{self.rank}</rank>\r\n"
+        return (
+            f"  <{self.tag_name}>\r\n"
+            f"    <id>{self.id_value}</id>\r\n"
+            f"    <name>{escapeAionXml(self.name)}</name>\r\n"
+            f"{optional}"
+            f"  </{self.tag_name}>\r\n"
+        )
+
+def writeAionXml(path: str, tag: str, parts: List[str]):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    # Encode the whole document in one call and write raw bytes; the text io
+    # layer would run its incremental encoder over the same data. The
+    # leading '\ufeff' encodes to the BOM.
+    document = ''.join(["\ufeff<?xml version=\"1.0\" encoding=\"utf-16\"?>\r\n", f"<{tag}>\r\n"] + parts + [f"</{tag}>\r\n"])
+    with open(path, 'wb') as f:
+        f.write(document.encode('utf-16-le'))
+
 VALID_TAGS = set(["id", "name", "body", "message_type", "display_type", "ment", "rank"])
 
+# Parsed-file cache for AionStringDict.read, keyed by path with the mtime
+# checked on every hit. main() syncs two packages over the same client,
+# reference and patch files, so each process parses a given file at most
+# once per on-disk version.
+READ_CACHE: Dict[str, tuple] = dict()
+
 @dataclass
 class AionStringDict:
     strings: Dict[int, AionString]
@@ -213,132 +215,181 @@ class AionStringDict:
             else:
                 raise Exception(f"'{path}' does not exist!")
 
-        with open(path, 'r', encoding='utf-16') as f:
-            xml_string = f.read()
-        
-        elements = parseAionXml(xml_string)
-
-        for string_element in elements.children:
-            if string_element.name != "string" and string_element.name != "string_tip":
-                raise Exception(f"Expected <string> or <string_tip> element, got <{string_element.name}> instead!")
-
-            for child in string_element.children:
-                if child.name not in VALID_TAGS:
-                    raise Exception(f"Unknow tag: <{child.name}>")
-
-            id_element = string_element.find('id')
-            if id_element is None:
+        mtime_ns = os.stat(path).st_mtime_ns
+        cached = READ_CACHE.get(path)
+        if cached is not None and cached[0] == mtime_ns:
+            strings = cached[1]
+            # match_and_repair mutates entries in place, so the cache keeps a
+            # pristine table and every caller gets fresh per-entry copies.
+            return AionStringDict({id_value: copy.copy(s) for id_value, s in strings.items()})
+
+        # Map the file and decode straight from the mapped pages; this skips
+        # the intermediate bytes copy a plain f.read() would allocate.
+        with open(path, 'rb') as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                xml_string = str(mm, 'utf-16')
+
+        for string_element in iterparseAionXml(xml_string):
+            if string_element.tag != "string" and string_element.tag != "string_tip":
+                raise Exception(f"Expected <string> or <string_tip> element, got <{string_element.tag}> instead!")
+
+            # Collect the child texts in one pass; find() would rescan the
+            # children once per field.
+            fields: Dict[str, str] = dict()
+            for child in string_element:
+                if child.tag not in VALID_TAGS:
+                    raise Exception(f"Unknow tag: <{child.tag}>")
+                fields[child.tag] = child.text or ''
+
+            if 'id' not in fields:
                 raise Exception(f"<id> element not found!")
-            id_value = int(id_element.text)
+            id_value = int(fields['id'])
 
-            name_element = string_element.find('name')
-            if name_element is None:
+            if 'name' not in fields:
                 raise Exception(f"<name> element not found for id {id_value}!")
-            name_value = name_element.text
-
-            body_element = string_element.find('body')
-            body_value = body_element.text if body_element is not None else None
-
-            message_type_element = string_element.find('message_type')
-            message_type_value = message_type_element.text if message_type_element is not None else None
+            name_value = fields['name']
 
-            display_type_element = string_element.find('display_type')
-            display_type_value = int(display_type_element.text) if display_type_element is not None else None 
+            body_value = fields.get('body')
+            # message_type/ment draw from a handful of recurring values and
+            # tag_name from two; interning dedupes them across tens of
+            # thousands of entries and lets the != checks in
+            # match_and_repair short-circuit on identity. Bodies and names
+            # are mostly unique, so interning those would only bloat the
+            # intern table.
+            message_type_value = sys.intern(fields['message_type']) if 'message_type' in fields else None
+            display_type_value = int(fields['display_type']) if 'display_type' in fields else None
+            ment_value = sys.intern(fields['ment']) if 'ment' in fields else None
+            rank_value = int(fields['rank']) if 'rank' in fields else None
 
-            ment_element = string_element.find('ment')
-            ment_value = ment_element.text if ment_element is not None else None
+            body_exprs = body_expressions(body_value) if body_value else frozenset()
 
-            rank_element = string_element.find('rank')
-            rank_value = int(rank_element.text) if rank_element is not None else None 
-            
-            strings[id_value] = AionString(string_element.name, id_value, name_value, body_value, message_type_value, display_type_value, ment_value, rank_value)
+            strings[id_value] = AionString(sys.intern(string_element.tag), id_value, name_value, body_value, message_type_value, display_type_value, ment_value, rank_value, body_exprs)
 
-        return AionStringDict(strings)
+        READ_CACHE[path] = (mtime_ns, strings)
+        return AionStringDict({id_value: copy.copy(s) for id_value, s in strings.items()})
 
     def write(self, path: str, tag):
-        os.makedirs(os.path.dirname(path), exist_ok=True)
-        with open(path, 'w', encoding='utf-16-le', newline='') as f:
-            f.write("\ufeff<?xml version=\"1.0\" encoding=\"utf-16\"?>\r\n")
-            f.write(f"<{tag}>\r\n")
-            for id_value in sorted(self.strings):
-                s: AionString = self.strings[id_value]
-                f.write(f"  <{s.tag_name}>\r\n")
-                f.write(f"    <id>{s.id_value}</id>\r\n")
-                f.write(f"    <name>{s.name}</name>\r\n")
-                if s.body is not None:
-                    f.write(f"    <body>{s.body}</body>\r\n")
-                if s.message_type is not None:
-                    f.write(f"    <message_type>{s.message_type}</message_type>\r\n")
-                if s.display_type is not None:
-                    f.write(f"    <display_type>{s.display_type}</display_type>\r\n")
-                if s.ment is not None:
-                    f.write(f"    <ment>{s.ment}</ment>\r\n")
-                if s.rank is not None:
-                    f.write(f"    <rank>{s.rank}</rank>\r\n")
-                f.write(f"  </{s.tag_name}>\r\n")
-            f.write(f"</{tag}>\r\n")
+        # One sorted key scan straight into serialize; no intermediate
+        # id-ordered dict is built.
+        writeAionXml(path, tag, [self.strings[id_value].serialize() for id_value in sorted(self.strings)])
+
+def block_buffer_stdout():
+    # The repair/missing logs can run to thousands of lines, and on a tty a
+    # line-buffered flush per print costs more than the sync itself. Buffers
+    # are flushed explicitly at the end of main().
+    try:
+        sys.stdout.reconfigure(line_buffering=False, write_through=False)
+    except (AttributeError, ValueError):
+        pass
+
+@functools.lru_cache(maxsize=None)
+def listdir_lowercase(path: str) -> Dict[str, str]:
+    # All the string files resolve through the same few directories, whose
+    # contents do not change during a run; list each directory once. Missing
+    # or unreadable directories map to an empty index — lru_cache does not
+    # cache exceptions, so raising here would retry the failing syscall on
+    # every lookup.
+    try:
+        return {name.lower(): name for name in os.listdir(path)}
+    except OSError:
+        return dict()
 
 def case_insensitive_path(base_path: str, rel_path: str):
     rel_path_components = rel_path.split(os.sep)
     for path_component in rel_path_components:
-        try:
-            matching_names = [name for name in os.listdir(base_path) if path_component.lower() == name.lower()]
-            if len(matching_names) > 0:
-                base_path = os.path.join(base_path, matching_names[0])
-            else:
-                base_path = os.path.join(base_path, path_component)
-        except:
-            base_path = os.path.join(base_path, path_component)
+        matching_name = listdir_lowercase(base_path).get(path_component.lower(), path_component)
+        base_path = os.path.join(base_path, matching_name)
     return base_path
 
-def sync_strings(relpath: str, client_dir: str, reference_dir: str, patch_dir: str, output_dir: str, variant_dir: Optional[str], tag: str, silent: bool):
-    print()
-    print()
-    print(f"Checking file '{relpath}'")
-
-    client_dict = AionStringDict.read(case_insensitive_path(client_dir, relpath))
-    l10n_reference__dict = AionStringDict.read(case_insensitive_path(reference_dir, relpath))
-    l10n_patch_dict = AionStringDict.read(case_insensitive_path(patch_dir, relpath), allow_missing=True)
-
-    # Merge english and custom patch dict
+def sync_strings(relpath: str, client_dir: str, reference_dir: str, patch_dir: str, output_dir: str, variant_dir: Optional[str], tag: str, silent: bool, cached_digest: Optional[str] = None):
+    # Runs in a pool worker: log lines are returned to the parent, which
+    # prints them grouped per file and in submission order. The second
+    # return value is the input digest recorded in the sync cache.
+    log: List[str] = list()
+    log.append("")
+    log.append("")
+    log.append(f"Checking file '{relpath}'")
+
+    client_path = case_insensitive_path(client_dir, relpath)
+    reference_path = case_insensitive_path(reference_dir, relpath)
+    patch_path = case_insensitive_path(patch_dir, relpath)
+    input_paths = [client_path, reference_path, patch_path]
     if variant_dir is not None:
-        l10n_variant_dict = AionStringDict.read(case_insensitive_path(variant_dir, relpath), allow_missing=True)
-        l10n_dict = AionStringDict({**l10n_reference__dict.strings, **l10n_patch_dict.strings, **l10n_variant_dict.strings})
-    else:
-        l10n_dict = AionStringDict({**l10n_reference__dict.strings, **l10n_patch_dict.strings})
-
-    client_dict_keys = set(client_dict.strings.keys())
-    l10n_dict_keys = set(l10n_dict.strings.keys())
-
-    # l10n strings not in client
-    for k in l10n_dict_keys.difference(client_dict_keys):
+        input_paths.append(case_insensitive_path(variant_dir, relpath))
+
+    output_path = os.path.join(output_dir, relpath)
+    if cached_digest is not None and os.path.exists(output_path):
+        if compute_input_digest(input_paths) == cached_digest:
+            log.append("Inputs unchanged since last run, keeping existing output")
+            return log, cached_digest
+
+    # Read all input dictionaries concurrently: the open/mmap/decode part of
+    # each read releases the GIL, so a few threads overlap the file I/O even
+    # though the parsing itself stays serialized.
+    with ThreadPoolExecutor(max_workers=len(input_paths)) as reader:
+        client_future = reader.submit(AionStringDict.read, client_path)
+        reference_future = reader.submit(AionStringDict.read, reference_path)
+        patch_future = reader.submit(AionStringDict.read, patch_path, allow_missing=True)
+        variant_future = reader.submit(AionStringDict.read, input_paths[3], allow_missing=True) if variant_dir is not None else None
+        client_dict = client_future.result()
+        l10n_reference__dict = reference_future.result()
+        l10n_patch_dict = patch_future.result()
+
+    # Merge english and custom patch dict ({**a, **b} would allocate a fresh
+    # dict per source; one copy plus in-place updates is enough)
+    merged_strings = dict(l10n_reference__dict.strings)
+    merged_strings.update(l10n_patch_dict.strings)
+    if variant_future is not None:
+        merged_strings.update(variant_future.result().strings)
+    l10n_dict = AionStringDict(merged_strings)
+
+    # l10n strings not in client (dict keys views subtract in C without
+    # materializing either side as a set first)
+    for k in l10n_dict.strings.keys() - client_dict.strings.keys():
         if not silent:
-            print(f"[warn] {k}|{l10n_dict.strings[k].name} exists in l10n but not in client")
+            log.append(f"[warn] {k}|{l10n_dict.strings[k].name} exists in l10n but not in client")
         # Clear key from dictionaries before outputting files
         l10n_dict.strings.pop(k, None)
         l10n_patch_dict.strings.pop(k, None)
 
-    # client strings not handled by l10n
-    for k in client_dict_keys.difference(l10n_dict_keys):
-        if not silent:
-            print(f"{k}|{client_dict.strings[k].name} MISSING from l10n!")
-        l10n_patch_dict.strings[k] = client_dict.strings[k]
+    # One pass over the client table covers both the missing and the
+    # kor/eng mismatch cases, without materializing key sets
+    for k, client_string in client_dict.strings.items():
+        l10n_string = l10n_dict.strings.get(k)
+        if l10n_string is None:
+            if not silent:
+                log.append(f"{k}|{client_string.name} MISSING from l10n!")
+            l10n_patch_dict.strings[k] = client_string
+        elif not client_string.match_and_repair(l10n_string, silent=silent, log=log.append):
+            l10n_patch_dict.strings[k] = client_string
+
+    # l10n_dict is not read again below: fold the patch entries into its
+    # table in place rather than copying it one more time
+    output_strings = l10n_dict.strings
+    output_strings.update(l10n_patch_dict.strings)
+
+    if variant_dir is None and len(l10n_patch_dict.strings) > 0:
+        # update patch dictionary file and output translation file from one
+        # sorted traversal: after the update() above the patch entries are
+        # the output entries, so each record serializes exactly once
+        output_parts: List[str] = list()
+        patch_parts: List[str] = list()
+        for id_value in sorted(output_strings):
+            block = output_strings[id_value].serialize()
+            output_parts.append(block)
+            if id_value in l10n_patch_dict.strings:
+                patch_parts.append(block)
+        writeAionXml(os.path.join(patch_dir, relpath), tag, patch_parts)
+        writeAionXml(output_path, tag, output_parts)
+    else:
+        # output translation file
+        AionStringDict(output_strings).write(output_path, tag)
 
-    # check mismatch between kor/eng
-    for k in client_dict_keys.intersection(l10n_dict_keys):
-        if not client_dict.strings[k].match_and_repair(l10n_dict.strings[k], silent=silent):
-            l10n_patch_dict.strings[k] = client_dict.strings[k]
+    # Digest after the writes above so a repaired patch file is recorded
+    # with its final bytes and the next run can hit the cache.
+    return log, compute_input_digest(input_paths)
 
-    if variant_dir is None:
-        # update patch dictionary file
-        if len(l10n_patch_dict.strings) > 0:
-            l10n_patch_dict.write(os.path.join(patch_dir, relpath), tag)
-
-    # output translation file
-    output_dict = AionStringDict({**l10n_dict.strings, **l10n_patch_dict.strings})
-    output_dict.write(os.path.join(output_dir, relpath), tag)
-    
-def sync_all_strings(client_dir: str, reference_dir: str, patch_dir: str, output_dir: str, variant_dir: str, silent: bool):
+def sync_all_strings(client_dir: str, reference_dir: str, patch_dir: str, output_dir: str, variant_dir: str, silent: bool, executor: ProcessPoolExecutor, sync_cache: Dict[str, str]):
     STRING_FILES = [
         'client_strings_bm.xml',
         'client_strings_bmrestrict.xml',
@@ -362,37 +413,49 @@ def sync_all_strings(client_dir: str, reference_dir: str, patch_dir: str, output
         'StringTable_Dialog.xml',
     ]
 
-    for string_file in STRING_FILES:
-        sync_strings(
-            relpath=os.path.join('data', 'strings', string_file),
-            client_dir=client_dir,
-            reference_dir=reference_dir,
-            patch_dir=patch_dir,
-            output_dir=output_dir,
-            variant_dir=variant_dir,
-            tag="strings",
-            silent=silent)
-
     STRING_TIPS_FILES = [
         'stringtable_tip.xml'
     ]
 
-    for string_tip_file in STRING_TIPS_FILES:
-        sync_strings(
-            relpath=os.path.join('data', 'strings', string_tip_file),
-            client_dir=client_dir,
-            reference_dir=reference_dir,
-            patch_dir=patch_dir,
-            output_dir=output_dir,
-            variant_dir=variant_dir,
-            tag="string_tips",
-            silent=silent)
-
-def make_package(client_dir: str, reference_dir: str, patch_dir: str, output_dir: str, variant_dir: str, silent: bool):
+    # Each file is independent (disjoint inputs and outputs), so sync them
+    # across all cores instead of one after the other. Workers return their
+    # log lines and the parent prints them in submission order, so the
+    # output stays deterministic.
+    jobs = [(string_file, "strings") for string_file in STRING_FILES]
+    jobs += [(string_tip_file, "string_tips") for string_tip_file in STRING_TIPS_FILES]
+
+    futures = []
+    for string_file, tag in jobs:
+        relpath = os.path.join('data', 'strings', string_file)
+        cache_key = os.path.join(output_dir, relpath)
+        future = executor.submit(sync_strings, relpath, client_dir, reference_dir, patch_dir, output_dir, variant_dir, tag, silent, sync_cache.get(cache_key))
+        futures.append((cache_key, future))
+
+    for cache_key, future in futures:
+        log, digest = future.result()
+        sync_cache[cache_key] = digest
+        for line in log:
+            print(line)
+
+def make_package(client_dir: str, reference_dir: str, patch_dir: str, output_dir: str, variant_dir: str, silent: bool, executor: ProcessPoolExecutor, sync_cache: Dict[str, str]):
+
+    # The five published subtrees copied verbatim into each package: four
+    # from the reference dir, data\ui from the patch dir.
+    copy_jobs = [
+        ("reference l10n textures", os.path.join(reference_dir, 'textures'), os.path.join(output_dir, 'textures')),
+        ("reference l10n data\\dialogs", os.path.join(reference_dir, 'data', 'dialogs'), os.path.join(output_dir, 'data', 'dialogs')),
+        ("reference l10n data\\cutscene", os.path.join(reference_dir, 'data', 'cutscene'), os.path.join(output_dir, 'data', 'cutscene')),
+        ("reference l10n data\\strings\\error", os.path.join(reference_dir, 'data', 'strings', 'error'), os.path.join(output_dir, 'data', 'strings', 'error')),
+        ("patch l10n data\\ui", os.path.join(patch_dir, 'data', 'ui'), os.path.join(output_dir, 'data', 'ui')),
+    ]
 
-    if os.path.exists(output_dir):
-        shutil.rmtree(output_dir)
-    os.makedirs(output_dir)
+    # Clear the published subtrees that get copied below, but keep the
+    # generated string files from the previous run: sync_strings reuses
+    # them when the sync cache reports unchanged inputs.
+    for _, _, destination in copy_jobs:
+        if os.path.exists(destination):
+            shutil.rmtree(destination)
+    os.makedirs(output_dir, exist_ok=True)
 
 
     if variant_dir is None:
@@ -406,36 +469,53 @@ def make_package(client_dir: str, reference_dir: str, patch_dir: str, output_dir
         patch_dir=patch_dir,
         output_dir=output_dir,
         variant_dir=variant_dir,
-        silent=silent)
-
-    print(f"Copying reference l10n textures to output directory...")
-    shutil.copytree(os.path.join(reference_dir, 'textures'), os.path.join(output_dir, 'textures'))
-    print(f"Copying reference l10n data\\dialogs to output directory...")
-    shutil.copytree(os.path.join(reference_dir, 'data', 'dialogs'), os.path.join(output_dir, 'data', 'dialogs'))
-    print(f"Copying reference l10n data\\cutscene to output directory...")
-    shutil.copytree(os.path.join(reference_dir, 'data', 'cutscene'), os.path.join(output_dir, 'data', 'cutscene'))
-    print(f"Copying reference l10n data\\strings\\error to output directory...")
-    shutil.copytree(os.path.join(reference_dir, 'data', 'strings', 'error'), os.path.join(output_dir, 'data', 'strings', 'error'))
-
-    print(f"Copying patch l10n data\\ui to output directory...")
-    shutil.copytree(os.path.join(patch_dir, 'data', 'ui'), os.path.join(output_dir, 'data', 'ui'))
+        silent=silent,
+        executor=executor,
+        sync_cache=sync_cache)
+
+    # copy_function=shutil.copyfile skips the per-file copystat() of the
+    # default copy2; the published tree does not need source timestamps and
+    # copyfile keeps the fast sendfile/CopyFile path of the platform.
+    # The copies are I/O-bound and copyfile releases the GIL, so the five
+    # trees copy in parallel threads.
+    with ThreadPoolExecutor(max_workers=len(copy_jobs)) as copier:
+        copy_futures = []
+        for label, source, destination in copy_jobs:
+            print(f"Copying {label} to output directory...")
+            copy_futures.append(copier.submit(shutil.copytree, source, destination, copy_function=shutil.copyfile))
+        for future in copy_futures:
+            future.result()
 
 def main():
-    make_package(
-        client_dir=CLIENT_DIR,
-        reference_dir=L10N_REFERENCE_DIR,
-        patch_dir=L10N_PATCH_DIR,
-        output_dir=OUTPUT_DIR,
-        variant_dir=None,
-        silent=False)
-
-    make_package(
-        client_dir=CLIENT_DIR,
-        reference_dir=L10N_REFERENCE_DIR,
-        patch_dir=L10N_PATCH_DIR,
-        output_dir=OUTPUT_KRLFG,
-        variant_dir=VARIANT_KRLFG,
-        silent=True)
+    block_buffer_stdout()
+
+    sync_cache = load_sync_cache()
+
+    # One worker pool shared by both package runs, so the per-process caches
+    # (READ_CACHE, body_expressions) stay warm for the krlfg pass.
+    with ProcessPoolExecutor() as executor:
+        make_package(
+            client_dir=CLIENT_DIR,
+            reference_dir=L10N_REFERENCE_DIR,
+            patch_dir=L10N_PATCH_DIR,
+            output_dir=OUTPUT_DIR,
+            variant_dir=None,
+            silent=False,
+            executor=executor,
+            sync_cache=sync_cache)
+
+        make_package(
+            client_dir=CLIENT_DIR,
+            reference_dir=L10N_REFERENCE_DIR,
+            patch_dir=L10N_PATCH_DIR,
+            output_dir=OUTPUT_KRLFG,
+            variant_dir=VARIANT_KRLFG,
+            silent=True,
+            executor=executor,
+            sync_cache=sync_cache)
+
+    save_sync_cache(sync_cache)
+    sys.stdout.flush()
 
 if __name__ == '__main__':
     main()